@@ -0,0 +1,22 @@
+# Gunicorn configuration for the Document Search API
+# The app module is imported once in the master (--preload) and forked into the workers;
+# each worker then loads and warms up its models in the FastAPI startup event.
+# The MongoClient is created with connect=False, so its connections and monitor threads
+# are opened in each worker after the fork rather than inherited from the master.
+import os
+
+# The app import in the master calls torch.cuda.is_available() to pick devices. By default
+# that initializes the CUDA driver, after which no forked worker can use CUDA ("Cannot
+# re-initialize CUDA in forked subprocess"). The NVML-based check answers without
+# initializing CUDA, so each worker still sets up its own context after the fork.
+os.environ.setdefault("PYTORCH_NVML_BASED_CUDA_CHECK", "1")
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8888')}"
+# Exported so the app can split CPU inference threads between the worker processes
+workers = int(os.environ.setdefault("WEB_CONCURRENCY", "4"))
+# UvicornWorker picks uvloop and httptools (from uvicorn[standard]) over asyncio and h11
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+# Model loading + warmup happens at worker boot; no request timeout (long transcriptions/LLM calls)
+timeout = 0
+graceful_timeout = 60
@@ -321,6 +321,40 @@ data:
   OLLAMA_URL: "${OLLAMA_URL}"
   OLLAMA_MODEL: "${OLLAMA_MODEL}"
 ---
+# Read-only access for the /health/system Kubernetes panel (pods, services, deployments)
+apiVersion: v1
+kind: ServiceAccount
+metadata:
+  name: search-backend
+  namespace: ${NAMESPACE}
+---
+apiVersion: rbac.authorization.k8s.io/v1
+kind: Role
+metadata:
+  name: search-backend-health-reader
+  namespace: ${NAMESPACE}
+rules:
+- apiGroups: [""]
+  resources: ["pods", "services"]
+  verbs: ["get", "list"]
+- apiGroups: ["apps"]
+  resources: ["deployments"]
+  verbs: ["get", "list"]
+---
+apiVersion: rbac.authorization.k8s.io/v1
+kind: RoleBinding
+metadata:
+  name: search-backend-health-reader
+  namespace: ${NAMESPACE}
+subjects:
+- kind: ServiceAccount
+  name: search-backend
+  namespace: ${NAMESPACE}
+roleRef:
+  apiGroup: rbac.authorization.k8s.io
+  kind: Role
+  name: search-backend-health-reader
+---
 apiVersion: apps/v1
 kind: Deployment
 metadata:
@@ -338,6 +372,7 @@ spec:
       labels:
         app: search-backend
     spec:
+      serviceAccountName: search-backend
       containers:
       - name: backend
         
@@ -890,7 +890,9 @@ function App() {
       };
       console.log('📤 Sending chat request with system_prompt:', requestBody.system_prompt || '(using default)');
       
-      const response = await fetch(`${API_URL}/chat`, {
+      // /chat/stream sends the sources first, then the answer token by token (SSE), so
+      // the answer starts rendering as soon as the LLM produces its first token
+      const response = await fetch(`${API_URL}/chat/stream`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -899,22 +901,59 @@ function App() {
       });
 
       if (response.ok) {
-        const data = await response.json();
-        
-        // Capture MongoDB operation details
-        if (data.mongodb_operation) {
-          setMongodbOps(prev => ({ ...prev, chat: data.mongodb_operation }));
-        }
-        
-        // Add AI response to chat history with MongoDB operation
-        const aiMessage = {
-          type: 'ai',
-          content: data.answer,
-          sources: data.sources,
-          model: data.model_used,
-          mongodb_operation: data.mongodb_operation
+        const appendToAnswer = (text) => {
+          setChatHistory(prev => {
+            const last = prev[prev.length - 1];
+            return [...prev.slice(0, -1), { ...last, content: last.content + text }];
+          });
         };
-        setChatHistory(prev => [...prev, aiMessage]);
+
+        const handleEvent = (event, data) => {
+          if (event === 'sources') {
+            // Capture MongoDB operation details
+            if (data.mongodb_operation) {
+              setMongodbOps(prev => ({ ...prev, chat: data.mongodb_operation }));
+            }
+            // Add AI response to chat history with MongoDB operation; tokens fill it in
+            setChatHistory(prev => [...prev, {
+              type: 'ai',
+              content: '',
+              sources: data.sources,
+              model: data.model_used,
+              mongodb_operation: data.mongodb_operation
+            }]);
+          } else if (event === 'error') {
+            setChatHistory(prev => [...prev, {
+              type: 'error',
+              content: `Error: ${data.detail || 'Failed to get answer'}`
+            }]);
+          } else if (data.token) {
+            appendToAnswer(data.token);
+          }
+        };
+
+        // Parse the SSE stream: events are separated by a blank line, each with an
+        // optional "event:" line and one "data:" line of JSON
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        for (;;) {
+          const { done, value } = await reader.read();
+          if (done) break;
+          buffer += decoder.decode(value, { stream: true });
+          let boundary;
+          while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const rawEvent = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            let event = null;
+            let data = null;
+            for (const line of rawEvent.split('\n')) {
+              if (line.startsWith('event: ')) event = line.slice(7);
+              else if (line.startsWith('data: ')) data = JSON.parse(line.slice(6));
+            }
+            if (data) handleEvent(event, data);
+          }
+        }
       } else {
         const error = await response.json();
         const errorMessage = {
@@ -941,11 +980,13 @@ function App() {
   }, [chatHistory]);
 
   // System health check function
-  const checkSystemHealth = async () => {
+  // The backend serves a snapshot cached for ~30s; fresh=true (the Refresh button) bypasses it
+  const checkSystemHealth = async (fresh = false) => {
     setIsLoadingHealth(true);
     try {
-      console.log('🔍 Fetching system health from:', `${API_URL}/health/system`);
-      const response = await fetch(`${API_URL}/health/system`);
+      const healthUrl = `${API_URL}/health/system${fresh ? '?fresh=true' : ''}`;
+      console.log('🔍 Fetching system health from:', healthUrl);
+      const response = await fetch(healthUrl);
       console.log('📡 Response status:', response.status, response.statusText);
       
       if (response.ok) {
@@ -1598,7 +1639,7 @@ function App() {
                 flexWrap: 'wrap'
               }}>
                 <button 
-                  onClick={checkSystemHealth}
+                  onClick={() => checkSystemHealth(true)}
                   disabled={isLoadingHealth}
                   style={{
                     padding: '10px 20px',